@@ -1,4 +1,5 @@
 import logging
+import signal
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -42,8 +43,14 @@ def main():
         # Initialize forwarder
         forwarder = Forwarder(instagram_client, config, storage)
         
-        # Get target username from user input
-        target_username = input("Enter Instagram username target: ")
+        # Get target username from user input unless targets are listed in the config file
+        target_username = None
+        if not config.get_targets():
+            target_username = input("Enter Instagram username target: ")
+        
+        # Reload the config file on SIGHUP (not available on Windows)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, forwarder.request_reload)
         
         # Run the forwarder
         forwarder.run(target_username)
@@ -4,11 +4,43 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Tuple, Optional, Set, Dict, Any
 
+import requests
 from instagrapi import Client
+from instagrapi.exceptions import (
+    ChallengeRequired,
+    ClientConnectionError,
+    ClientIncompleteReadError,
+    ClientRequestTimeout,
+    ClientThrottledError,
+    FeedbackRequired,
+    LoginRequired,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
 
 from instagram_forwarder.storage.storage import Storage
 
 
+# Errors meaning Instagram is rate limiting or challenging the account, as opposed to a transient failure
+THROTTLE_EXCEPTIONS = (
+    ChallengeRequired,
+    ClientThrottledError,
+    FeedbackRequired,
+    LoginRequired,
+    PleaseWaitFewMinutes,
+    RateLimitError,
+)
+
+# Errors meaning Instagram or the network is unavailable, as opposed to a client error such as an unknown user
+UNAVAILABLE_EXCEPTIONS = (
+    ClientConnectionError,
+    ClientIncompleteReadError,
+    ClientRequestTimeout,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
 class InstagramClient:
     """
     Instagram client manager for the Instagram Forwarder application.
@@ -158,4 +190,36 @@ class InstagramClient:
         Returns:
             Post URL
         """
-        return f"https://www.instagram.com/p/{media_code}/" 
\ No newline at end of file
+        return f"https://www.instagram.com/p/{media_code}/"
+    
+    @staticmethod
+    def is_throttled(error: Exception) -> bool:
+        """
+        Check whether an error means Instagram is throttling requests.
+        
+        Args:
+            error: Exception raised by an Instagram API call or download
+            
+        Returns:
+            True if the error is caused by rate limiting or a challenge, False otherwise
+        """
+        if isinstance(error, THROTTLE_EXCEPTIONS):
+            return True
+        response = getattr(error, "response", None)
+        return isinstance(response, requests.Response) and response.status_code == 429 
+    
+    @staticmethod
+    def is_unavailable(error: Exception) -> bool:
+        """
+        Check whether an error means Instagram is unreachable or failing.
+        
+        Args:
+            error: Exception raised by an Instagram API call or download
+            
+        Returns:
+            True if the error is a network error or a 5xx response, False otherwise
+        """
+        if isinstance(error, UNAVAILABLE_EXCEPTIONS):
+            return True
+        response = getattr(error, "response", None)
+        return isinstance(response, requests.Response) and response.status_code >= 500
\ No newline at end of file
@@ -2,7 +2,7 @@ import json
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 class Config:
     """
@@ -17,7 +17,7 @@ class Config:
             config_file: Path to the configuration file
         """
         self.config_file = config_file
-        self.config_data = self._load_config()
+        self.config_mtime = self._get_mtime()
         
         # Environment variables
         self.instagram_username = os.getenv("INSTAGRAM_USERNAME")
@@ -25,11 +25,30 @@ class Config:
         self.discord_webhook_url_1 = os.getenv("DISCORD_WEBHOOK_URL_1")
         self.discord_webhook_url_2 = os.getenv("DISCORD_WEBHOOK_URL_2")
         
-        # Validate required environment variables
-        if not all([self.instagram_username, self.instagram_password, self.discord_webhook_url_1]):
+        self.config_data = self._load_config()
+        
+        # Validate required environment variables, webhooks may also come from the config file
+        if not all([self.instagram_username, self.instagram_password, self.get_webhook_urls()]):
             raise EnvironmentError(
-                "Please set INSTAGRAM_USERNAME, INSTAGRAM_PASSWORD, and DISCORD_WEBHOOK_URL_1 environment variables."
+                "Please set INSTAGRAM_USERNAME and INSTAGRAM_PASSWORD environment variables, "
+                "and DISCORD_WEBHOOK_URL_1 or 'webhook_urls' in the config file."
             )
+        self._validate_config(self.config_data)
+        
+        # Runtime state is kept in memory so the config file is never rewritten under the user
+        self.webhook_counter = self.get("webhook_counter", 0)
+    
+    def _get_mtime(self) -> Optional[float]:
+        """
+        Get the modification time of the configuration file.
+        
+        Returns:
+            Modification time, None if the file doesn't exist or can't be read
+        """
+        try:
+            return self.config_file.stat().st_mtime
+        except OSError:
+            return None
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -51,6 +70,61 @@ class Config:
         """Save current configuration to file."""
         with open(self.config_file, "w") as file:
             json.dump(self.config_data, file, indent=4)
+        # Our own writes must not be mistaken for external edits
+        self.config_mtime = self._get_mtime()
+    
+    def has_changed(self) -> bool:
+        """
+        Check whether the configuration file was modified since it was last loaded or saved.
+        
+        Returns:
+            True if the file changed, False otherwise
+        """
+        return self._get_mtime() != self.config_mtime
+    
+    def _validate_config(self, config_data: Any) -> None:
+        """
+        Validate configuration values.
+        
+        Args:
+            config_data: Configuration values loaded from file
+            
+        Raises:
+            ValueError: If a value has the wrong type or range, or no webhook URL is configured
+        """
+        if not isinstance(config_data, dict):
+            raise ValueError("Config file must contain a JSON object")
+        
+        for key in ("targets", "webhook_urls"):
+            value = config_data.get(key, [])
+            if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+                raise ValueError(f"'{key}' must be a list of non-empty strings")
+        
+        for key in ("check_interval_min", "check_interval_max", "retry_delay"):
+            value = config_data.get(key, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"'{key}' must be a non-negative integer")
+        
+        if config_data.get("check_interval_min", 550) > config_data.get("check_interval_max", 600):
+            raise ValueError("'check_interval_min' must not be greater than 'check_interval_max'")
+        
+        if not config_data.get("webhook_urls") and not (self.discord_webhook_url_1 or self.discord_webhook_url_2):
+            raise ValueError("'webhook_urls' must not be empty when no DISCORD_WEBHOOK_URL_* is set")
+    
+    def reload(self) -> None:
+        """Reload configuration from file, keeping the current values if the file is invalid."""
+        self.config_mtime = self._get_mtime()
+        try:
+            with open(self.config_file, "r") as file:
+                config_data = json.load(file)
+            self._validate_config(config_data)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logging.error(f"Invalid config file: {self.config_file} ({e}), keeping current configuration")
+            return
+        self.config_data = config_data
+        logging.info(f"Reloaded config file: {self.config_file}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -75,6 +149,36 @@ class Config:
         """
         self.config_data[key] = value
     
+    def get_webhook_urls(self) -> List[str]:
+        """
+        Get all configured webhook URLs, preferring the config file over environment variables.
+        
+        Returns:
+            List of Discord webhook URLs
+        """
+        webhook_urls = self.get("webhook_urls", [])
+        if webhook_urls:
+            return list(webhook_urls)
+        return [url for url in (self.discord_webhook_url_1, self.discord_webhook_url_2) if url]
+    
+    def get_targets(self) -> List[str]:
+        """
+        Get the Instagram usernames to monitor.
+        
+        Returns:
+            List of Instagram usernames, empty if none are configured
+        """
+        return list(dict.fromkeys(self.get("targets", [])))
+    
+    def get_check_interval(self) -> Tuple[int, int]:
+        """
+        Get the range of the random delay between checks of a target.
+        
+        Returns:
+            Tuple containing the minimum and maximum delay in seconds
+        """
+        return self.get("check_interval_min", 550), self.get("check_interval_max", 600)
+    
     def get_webhook_url(self) -> str:
         """
         Get the next webhook URL to use in a round-robin fashion.
@@ -82,12 +186,10 @@ class Config:
         Returns:
             Discord webhook URL
         """
-        webhook_counter = self.get("webhook_counter", 0)
-        
-        webhook_url = self.discord_webhook_url_1 if webhook_counter % 2 == 0 else self.discord_webhook_url_2
+        webhook_urls = self.get_webhook_urls()
+        webhook_url = webhook_urls[self.webhook_counter % len(webhook_urls)]
         
         # Update webhook counter for next use
-        self.set("webhook_counter", webhook_counter + 1)
-        self.save_config()
+        self.webhook_counter += 1
         
-        return webhook_url 
\ No newline at end of file
+        return webhook_url
@@ -1,7 +1,9 @@
+import hashlib
 import logging
 import requests
 from pathlib import Path
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 
 
 class DiscordWebhook:
@@ -18,6 +20,56 @@ class DiscordWebhook:
             webhook_url: Discord webhook URL
         """
         self.webhook_url = webhook_url
+        self.last_status_code: Optional[int] = None
+        self.last_retry_after: Optional[float] = None
+    
+    @property
+    def webhook_id(self) -> str:
+        """
+        Get a stable identifier for the webhook that doesn't expose its token.
+        
+        Returns:
+            Webhook ID parsed from the URL, or a short hash of the URL if it has none
+        """
+        parts = urlparse(self.webhook_url).path.strip("/").split("/")
+        if "webhooks" in parts:
+            index = parts.index("webhooks")
+            if index + 1 < len(parts):
+                return parts[index + 1]
+        return hashlib.sha1(self.webhook_url.encode()).hexdigest()[:8]
+    
+    def _record_response(self, response: Optional[requests.Response]) -> None:
+        """
+        Record the status code and requested backoff of the last request.
+        
+        Args:
+            response: Response of the last request, None if it failed without one
+        """
+        self.last_status_code = response.status_code if response is not None else None
+        self.last_retry_after = None
+        if response is not None and response.status_code == 429:
+            try:
+                self.last_retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                pass
+    
+    def is_throttled(self) -> bool:
+        """
+        Check whether the last request was rate limited by Discord.
+        
+        Returns:
+            True if the last request returned status 429, False otherwise
+        """
+        return self.last_status_code == 429
+    
+    def is_unavailable(self) -> bool:
+        """
+        Check whether the last request failed because Discord was unreachable or erroring.
+        
+        Returns:
+            True if the last request raised or returned a 5xx status, False otherwise
+        """
+        return self.last_status_code is None or self.last_status_code >= 500
     
     def send_file(self, file_path: Path, username: str, avatar_url: str) -> bool:
         """
@@ -39,6 +91,7 @@ class DiscordWebhook:
                     "avatar_url": avatar_url,
                 }
                 response = requests.post(self.webhook_url, files=files, data=data)
+            self._record_response(response)
             
             if response.status_code == 200:
                 logging.info(f"File {file_path} successfully sent to Discord.")
@@ -49,6 +102,7 @@ class DiscordWebhook:
                 )
                 return False
         except Exception as e:
+            self._record_response(None)
             logging.error(f"Error sending file {file_path} to Discord: {e}")
             return False
     
@@ -71,6 +125,7 @@ class DiscordWebhook:
                 "content": content,
             }
             response = requests.post(self.webhook_url, json=data)
+            self._record_response(response)
             
             if response.status_code == 204:
                 logging.info(f"Message successfully sent to Discord.")
@@ -81,5 +136,6 @@ class DiscordWebhook:
                 )
                 return False
         except Exception as e:
+            self._record_response(None)
             logging.error(f"Error sending message to Discord: {e}")
             return False 
\ No newline at end of file
@@ -0,0 +1,200 @@
+import logging
+import random
+import time
+from typing import Any, Callable, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is attempted while a circuit breaker is open."""
+
+    def __init__(self, name: str, remaining: float):
+        """
+        Initialize the CircuitOpenError instance.
+
+        Args:
+            name: Name of the dependency guarded by the breaker
+            remaining: Seconds until the breaker allows a trial call
+        """
+        super().__init__(f"Circuit '{name}' is open, retry in {remaining:.0f} seconds")
+        self.name = name
+        self.remaining = remaining
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single external dependency.
+    Stops calls to an unhealthy dependency and lets a single trial call
+    through once an exponential, jittered backoff has elapsed. Further calls
+    are refused until the trial call records its result.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        base_delay: float = 30,
+        throttle_base_delay: float = 300,
+        max_delay: float = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the CircuitBreaker instance.
+
+        Args:
+            name: Name of the dependency, used in log messages
+            failure_threshold: Consecutive transient failures before opening
+            base_delay: Initial backoff in seconds after transient failures
+            throttle_base_delay: Initial backoff in seconds after throttling without a Retry-After hint
+            max_delay: Upper bound for the backoff in seconds
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.throttle_base_delay = throttle_base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.open_count = 0
+        self.trial_in_progress = False
+        self.opened_until = 0.0
+        self.trial_in_progress = False
+
+    def remaining(self) -> float:
+        """
+        Get the time left before the breaker allows a trial call.
+
+        Returns:
+            Seconds until the next call is allowed, 0 if calls are allowed now
+        """
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_until - self.clock())
+
+    def available(self) -> bool:
+        """
+        Check whether a call would be allowed, without starting a trial call.
+
+        Returns:
+            True if the breaker is closed or its backoff has elapsed, False otherwise
+        """
+        if self.state == self.HALF_OPEN:
+            return not self.trial_in_progress
+        return self.remaining() == 0
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made, starting the trial call once the backoff has elapsed.
+
+        The caller must record the result of an allowed call, otherwise the
+        breaker stays half-open and refuses every further call.
+
+        Returns:
+            True if the call may proceed, False otherwise
+        """
+        if not self.available():
+            return False
+        if self.state != self.CLOSED:
+            self.state = self.HALF_OPEN
+            self.trial_in_progress = True
+            logging.info(f"Circuit '{self.name}' half-open, allowing a trial call.")
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        if self.state != self.CLOSED:
+            logging.info(f"Circuit '{self.name}' closed, dependency recovered.")
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.open_count = 0
+        self.trial_in_progress = False
+
+    def record_failure(self, throttled: bool = False, retry_after: Optional[float] = None) -> None:
+        """
+        Record a failed call, opening the breaker when needed.
+
+        Throttling opens the breaker immediately, transient errors only once
+        the failure threshold is reached or a half-open trial call fails.
+
+        Args:
+            throttled: Whether the dependency rejected the call due to rate limiting
+            retry_after: Backoff in seconds requested by the dependency, if any
+        """
+        self.failure_count += 1
+        self.trial_in_progress = False
+        if throttled or self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self._open(throttled, retry_after)
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        is_throttled: Callable[[Exception], bool] = lambda e: False,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call a function through the breaker.
+
+        Exceptions that are neither throttling nor a dependency failure (e.g.
+        a user that doesn't exist) mean the dependency answered, so they count
+        as a success for the breaker and are re-raised.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for the function
+            is_throttled: Predicate classifying an exception as throttling
+            is_failure: Predicate classifying an exception as a transient dependency failure
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Return value of the function
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.remaining())
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_throttled(e):
+                self.record_failure(throttled=True)
+            elif is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def _open(self, throttled: bool, retry_after: Optional[float]) -> None:
+        """
+        Open the breaker for an exponentially growing, jittered delay.
+
+        Args:
+            throttled: Whether the failure was caused by rate limiting
+            retry_after: Backoff in seconds requested by the dependency, if any
+        """
+        if retry_after is not None:
+            # The dependency's hint is authoritative, so never wait less and only add jitter on top
+            ceiling = retry_after * (2 ** self.open_count)
+            delay = max(retry_after, min(self.max_delay, ceiling + random.uniform(0, ceiling / 2)))
+        else:
+            base = self.throttle_base_delay if throttled else self.base_delay
+            ceiling = min(self.max_delay, base * (2 ** self.open_count))
+            # Equal jitter: keep at least half the backoff so retries still spread out
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+
+        self.state = self.OPEN
+        self.open_count += 1
+        self.failure_count = 0
+        self.opened_until = self.clock() + delay
+        reason = "throttled" if throttled else "failing"
+        logging.warning(f"Circuit '{self.name}' opened ({reason}), pausing calls for {delay:.0f} seconds.")
@@ -1,14 +1,16 @@
 import logging
 import time
 import random
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple, Any
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
 
 from instagram_forwarder.client.instagram import InstagramClient
 from instagram_forwarder.discord.webhook import DiscordWebhook
 from instagram_forwarder.config.config import Config
 from instagram_forwarder.storage.storage import Storage
+from instagram_forwarder.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 
 class Forwarder:
@@ -29,6 +31,117 @@ class Forwarder:
         self.instagram_client = instagram_client
         self.config = config
         self.storage = storage
+        
+        # One circuit breaker per external dependency
+        self.instagram_breaker = CircuitBreaker("instagram_api")
+        self.cdn_breaker = CircuitBreaker("instagram_cdn")
+        self.webhook_breakers: Dict[str, CircuitBreaker] = {}
+        self.webhooks: Dict[str, DiscordWebhook] = {}
+        self.user_ids: Dict[str, int] = {}
+        
+        # Next check time per monitored target, kept in sync with the config on reload
+        self.next_checks: Dict[str, float] = {}
+        # Targets whose next check was scheduled by a failure rather than the check interval
+        self.retrying_targets: Set[str] = set()
+        self.check_interval = self.config.get_check_interval()
+        self.default_targets: List[str] = []
+        self.reload_event = threading.Event()
+    
+    def _call_instagram(self, func, *args, **kwargs) -> Any:
+        """
+        Call an Instagram API method through the Instagram API circuit breaker.
+        
+        Args:
+            func: Instagram client method to call
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            Return value of the method
+        """
+        return self.instagram_breaker.call(
+            func,
+            *args,
+            is_throttled=self.instagram_client.is_throttled,
+            is_failure=self.instagram_client.is_unavailable,
+            **kwargs,
+        )
+    
+    def _next_webhook(self) -> Tuple[DiscordWebhook, CircuitBreaker]:
+        """
+        Get the next webhook in round-robin order whose circuit breaker would allow a call.
+        
+        The breaker only starts its trial call in `_send_to_webhook`, right
+        before the request, so a failure in between can't leave it half-open.
+        
+        Returns:
+            Tuple containing the webhook and its circuit breaker
+            
+        Raises:
+            CircuitOpenError: If every webhook's circuit breaker is open
+        """
+        webhook_urls = self.config.get_webhook_urls()
+        for _ in range(len(webhook_urls)):
+            webhook_url = self.config.get_webhook_url()
+            if not webhook_url:
+                continue
+            if webhook_url not in self.webhooks:
+                self.webhooks[webhook_url] = DiscordWebhook(webhook_url)
+            webhook = self.webhooks[webhook_url]
+            if webhook_url not in self.webhook_breakers:
+                # Named after the webhook ID so log messages stay correct when the URL list changes
+                self.webhook_breakers[webhook_url] = CircuitBreaker(f"discord_webhook_{webhook.webhook_id}")
+            breaker = self.webhook_breakers[webhook_url]
+            if breaker.available():
+                return webhook, breaker
+        
+        remaining = min(
+            (self.webhook_breakers[url].remaining() for url in webhook_urls if url in self.webhook_breakers),
+            default=0.0,
+        )
+        raise CircuitOpenError("discord_webhooks", remaining)
+    
+    def _send_to_webhook(
+        self, webhook: DiscordWebhook, breaker: CircuitBreaker, send: Callable[..., bool], *args: Any
+    ) -> bool:
+        """
+        Send a request to a webhook through its circuit breaker.
+        
+        Args:
+            webhook: Webhook to send through
+            breaker: Circuit breaker guarding the webhook
+            send: Webhook method making the request
+            *args: Arguments for the method
+            
+        Returns:
+            True if the request was successful, False otherwise
+            
+        Raises:
+            CircuitOpenError: If the breaker refuses the call
+        """
+        if not breaker.allow():
+            raise CircuitOpenError(breaker.name, breaker.remaining())
+        sent = send(*args)
+        self._record_webhook_result(webhook, breaker)
+        return sent
+    
+    def _record_webhook_result(self, webhook: DiscordWebhook, breaker: CircuitBreaker) -> None:
+        """
+        Record the outcome of the last webhook request on its circuit breaker.
+        
+        Client errors other than rate limiting (e.g. a rejected payload) do not
+        mean Discord is unhealthy, so they count as a success for the breaker.
+        
+        Args:
+            webhook: Webhook that made the request
+            breaker: Circuit breaker guarding the webhook
+        """
+        if webhook.is_throttled():
+            breaker.record_failure(throttled=True, retry_after=webhook.last_retry_after)
+        elif webhook.is_unavailable():
+            breaker.record_failure()
+        else:
+            breaker.record_success()
     
     def download_and_forward_stories(
         self, story_data: List[Tuple[str, datetime]], target_username: str, user_info: Any, delay: int = 2
@@ -46,23 +159,41 @@ class Forwarder:
         
         for pk, taken_at in story_data:
             try:
+                # Pick the webhook first so nothing is downloaded while Discord is unavailable
+                discord, webhook_breaker = self._next_webhook()
+                
                 taken_at_utc7 = taken_at + timedelta(hours=7)
                 filename = f"{target_username}_stories_{taken_at_utc7.strftime('%d%m%y')}_{taken_at_utc7.strftime('%H%M%S')}"
-                file_path = self.instagram_client.download_story(
-                    pk, folder=user_folder, filename=filename
+                file_path = self.cdn_breaker.call(
+                    self.instagram_client.download_story,
+                    pk,
+                    folder=user_folder,
+                    filename=filename,
+                    is_throttled=self.instagram_client.is_throttled,
+                    is_failure=self.instagram_client.is_unavailable,
                 )
                 logging.info(f"Downloaded story with pk: {pk} to {file_path}")
                 
-                webhook_url = self.config.get_webhook_url()
-                discord = DiscordWebhook(webhook_url)
-                
-                if discord.send_file(file_path, user_info.full_name, str(user_info.profile_pic_url_hd)):
+                sent = self._send_to_webhook(
+                    discord,
+                    webhook_breaker,
+                    discord.send_file,
+                    file_path,
+                    user_info.full_name,
+                    str(user_info.profile_pic_url_hd),
+                )
+                if sent:
                     self.storage.delete_file(file_path)
                 else:
                     logging.warning(f"File {file_path} was not deleted due to failed Discord upload.")
                 
-                self.storage.save_story_id(pk, target_username)
+                # Leave the story unmarked when Discord was throttling or down so it is retried once it recovers
+                if sent or not (discord.is_throttled() or discord.is_unavailable()):
+                    self.storage.save_story_id(pk, target_username)
                 time.sleep(delay)
+            except CircuitOpenError as e:
+                logging.warning(f"Stopped processing stories: {e}")
+                return
             except Exception as e:
                 logging.error(f"Failed to process story with pk: {pk}. Error: {e}")
     
@@ -94,57 +225,172 @@ class Forwarder:
             try:
                 post_url = self.instagram_client.get_post_url(media.code)
                 
-                webhook_url = self.config.get_webhook_url()
-                discord = DiscordWebhook(webhook_url)
+                discord, webhook_breaker = self._next_webhook()
                 
-                if discord.send_message(post_url, user_info.full_name, str(user_info.profile_pic_url_hd)):
+                sent = self._send_to_webhook(
+                    discord,
+                    webhook_breaker,
+                    discord.send_message,
+                    post_url,
+                    user_info.full_name,
+                    str(user_info.profile_pic_url_hd),
+                )
+                if sent:
                     self.storage.save_post_id(media.pk, target_username)
                     logging.info(f"Forwarded post URL: {post_url}")
                 else:
                     logging.warning(f"Failed to forward post URL: {post_url}")
                 
                 time.sleep(delay)
+            except CircuitOpenError as e:
+                logging.warning(f"Stopped processing posts: {e}")
+                return
             except Exception as e:
                 logging.error(f"Failed to process post with pk: {media.pk}. Error: {e}")
     
-    def run(self, target_username: str) -> None:
+    def request_reload(self, *args: Any) -> None:
+        """
+        Request a configuration reload, usable as a signal handler.
+        
+        Args:
+            *args: Signal number and frame, ignored
+        """
+        self.reload_event.set()
+    
+    def reload_config(self) -> None:
+        """
+        Reload the configuration and apply the changes in place.
+        
+        Added targets are checked right away, removed targets and webhooks are
+        dropped along with their caches, and everything else (the Instagram
+        session, circuit breakers, cached user IDs) is kept. A shorter check
+        interval also brings forward checks that are already scheduled.
+        """
+        self.reload_event.clear()
+        self.config.reload()
+        
+        targets = self.config.get_targets() or self.default_targets
+        for target in targets:
+            if target not in self.next_checks:
+                logging.info(f"Started monitoring user: {target}")
+                self.next_checks[target] = 0.0
+        for target in list(self.next_checks):
+            if target not in targets:
+                logging.info(f"Stopped monitoring user: {target}")
+                del self.next_checks[target]
+                self.user_ids.pop(target, None)
+                self.retrying_targets.discard(target)
+        
+        check_interval = self.config.get_check_interval()
+        if check_interval != self.check_interval:
+            latest_check = time.monotonic() + check_interval[1]
+            for target, due in self.next_checks.items():
+                if target not in self.retrying_targets:
+                    self.next_checks[target] = min(due, latest_check)
+            self.check_interval = check_interval
+        
+        webhook_urls = self.config.get_webhook_urls()
+        for webhook_url in set(self.webhooks) | set(self.webhook_breakers):
+            if webhook_url not in webhook_urls:
+                self.webhooks.pop(webhook_url, None)
+                self.webhook_breakers.pop(webhook_url, None)
+    
+    def check_target(self, target_username: str) -> bool:
+        """
+        Check a user once and forward their new posts and stories.
+        
+        Args:
+            target_username: Instagram username to check
+            
+        Returns:
+            True if the check completed, False if it failed
+        """
+        logging.info(f"Fetching data for user: {target_username}")
+        
+        try:
+            # The user ID never changes, so only look it up once
+            if target_username not in self.user_ids:
+                self.user_ids[target_username] = self._call_instagram(
+                    self.instagram_client.get_user_id, target_username
+                )
+            user_id = self.user_ids[target_username]
+            user_info = self._call_instagram(self.instagram_client.get_user_info, user_id)
+            
+            # Fetch user media
+            user_media = self._call_instagram(self.instagram_client.get_user_media, user_id)
+            
+            # Extract and forward new posts
+            new_post_ids = self.instagram_client.extract_new_post_ids(user_media, target_username)
+            if new_post_ids:
+                logging.info(f"Found {len(new_post_ids)} new posts. Processing...")
+                self.forward_posts(user_media, target_username, user_info)
+            else:
+                logging.info("No new posts found.")
+            
+            # Fetch and forward new stories
+            user_stories = self._call_instagram(self.instagram_client.get_user_stories, user_id)
+            new_story_data = self.instagram_client.extract_new_story_ids(user_stories, target_username)
+            if new_story_data:
+                logging.info(f"Found {len(new_story_data)} new stories. Processing...")
+                self.download_and_forward_stories(new_story_data, target_username, user_info)
+            else:
+                logging.info("No new stories found.")
+            return True
+        except Exception as e:
+            logging.error(f"Error during forwarding for user {target_username}: {e}")
+            return False
+    
+    def _wait(self, delay: float, poll_interval: float = 5) -> None:
+        """
+        Wait before the next check, returning early when a reload is due.
+        
+        Args:
+            delay: Maximum time to wait in seconds
+            poll_interval: How often to check the config file for changes in seconds
+        """
+        deadline = time.monotonic() + delay
+        while time.monotonic() < deadline:
+            if self.config.has_changed():
+                self.reload_event.set()
+            if self.reload_event.wait(min(deadline - time.monotonic(), poll_interval)):
+                return
+    
+    def run(self, target_username: Optional[str] = None) -> None:
         """
         Run the forwarder continuously.
         
+        Targets listed in the config file take precedence over the given
+        username, and the config file is reloaded whenever it changes or
+        a reload is requested.
+        
         Args:
-            target_username: Instagram username to monitor
+            target_username: Instagram username to monitor if the config file lists no targets
         """
+        self.default_targets = [target_username] if target_username else []
+        self.reload_config()
+        
         while True:
-            logging.info(f"Fetching data for user: {target_username}")
+            if self.reload_event.is_set():
+                self.reload_config()
             
-            try:
-                user_id = self.instagram_client.get_user_id(target_username)
-                user_info = self.instagram_client.get_user_info(user_id)
-                
-                # Fetch user media
-                user_media = self.instagram_client.get_user_media(user_id)
-                
-                # Extract and forward new posts
-                new_post_ids = self.instagram_client.extract_new_post_ids(user_media, target_username)
-                if new_post_ids:
-                    logging.info(f"Found {len(new_post_ids)} new posts. Processing...")
-                    self.forward_posts(user_media, target_username, user_info)
-                else:
-                    logging.info("No new posts found.")
-                
-                # Fetch and forward new stories
-                user_stories = self.instagram_client.get_user_stories(user_id)
-                new_story_data = self.instagram_client.extract_new_story_ids(user_stories, target_username)
-                if new_story_data:
-                    logging.info(f"Found {len(new_story_data)} new stories. Processing...")
-                    self.download_and_forward_stories(new_story_data, target_username, user_info)
+            if not self.next_checks:
+                logging.warning("No targets configured, waiting for a config change...")
+                self._wait(60)
+                continue
+            
+            for target in [t for t, due in self.next_checks.items() if due <= time.monotonic()]:
+                if self.check_target(target):
+                    min_delay, max_delay = self.config.get_check_interval()
+                    delay = random.randint(min_delay, max_delay)
+                    self.retrying_targets.discard(target)
                 else:
-                    logging.info("No new stories found.")
-                
-                # Wait before the next check
-                delay = random.randint(550, 600)
-                logging.info(f"Waiting for {delay} seconds before the next check...")
-                time.sleep(delay)
-            except Exception as e:
-                logging.error(f"Error during forwarding: {e}")
-                time.sleep(60)  # Wait a minute before retrying 
\ No newline at end of file
+                    # Wait until the Instagram API breaker allows a trial call, or the retry delay if it is still closed
+                    delay = self.instagram_breaker.remaining() or self.config.get("retry_delay", 60)
+                    self.retrying_targets.add(target)
+                if target in self.next_checks:
+                    self.next_checks[target] = time.monotonic() + delay
+            
+            # Wait before the next check
+            delay = max(0.0, min(self.next_checks.values()) - time.monotonic())
+            logging.info(f"Waiting for {delay:.0f} seconds before the next check...")
+            self._wait(delay)
@@ -0,0 +1,108 @@
+import pytest
+
+from instagram_forwarder.utils import circuit_breaker
+from instagram_forwarder.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    """Make the backoff deterministic by always using the full jittered delay."""
+    monkeypatch.setattr(circuit_breaker.random, "uniform", lambda a, b: b)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+def test_opens_after_failure_threshold(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, base_delay=10, clock=clock)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.remaining() == 10
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: None)
+
+
+def test_throttle_opens_immediately(clock):
+    breaker = CircuitBreaker("test", throttle_base_delay=100, clock=clock)
+    breaker.record_failure(throttled=True)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.remaining() == 100
+
+
+def test_retry_after_replaces_throttle_base_delay(clock):
+    breaker = CircuitBreaker("test", throttle_base_delay=300, clock=clock)
+    breaker.record_failure(throttled=True, retry_after=5)
+    assert breaker.remaining() == 7.5
+
+    clock.now += 7.5
+    assert breaker.allow()
+    breaker.record_failure(throttled=True, retry_after=5)
+    assert breaker.remaining() == 15
+
+
+def test_half_open_allows_a_single_trial(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, base_delay=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 10
+    assert breaker.available()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.available()
+    assert not breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: None)
+
+
+def test_half_open_trial_closes_or_reopens(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, base_delay=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 10
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.remaining() == 20
+
+    clock.now += 20
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.open_count == 0
+
+
+def test_backoff_is_capped(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, base_delay=10, max_delay=50, clock=clock)
+    delays = []
+    for _ in range(5):
+        breaker.record_failure()
+        delays.append(breaker.remaining())
+        clock.now += breaker.remaining()
+        breaker.allow()
+    assert delays == [10, 20, 40, 50, 50]
+
+
+def test_non_failure_errors_count_as_success(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, clock=clock)
+    with pytest.raises(LookupError):
+        breaker.call(lambda: {}["missing"], is_failure=lambda e: not isinstance(e, LookupError))
+    assert breaker.state == CircuitBreaker.CLOSED
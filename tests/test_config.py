@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from instagram_forwarder.config.config import Config
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_USERNAME", "user")
+    monkeypatch.setenv("INSTAGRAM_PASSWORD", "password")
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_1", raising=False)
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL_2", raising=False)
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "configs.json"
+    config_file.write_text(json.dumps({"targets": ["alice"], "webhook_urls": ["https://example.com/1"]}))
+    return config_file
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"targets": ["alice", "bob",], "webhook_urls": ["https://example.com/1"]}',
+        '{"targets": "bob", "webhook_urls": ["https://example.com/1"]}',
+        '{"targets": ["bob"], "webhook_urls": "https://example.com/2"}',
+        '{"targets": ["bob"], "webhook_urls": []}',
+        '{"targets": ["bob"], "webhook_urls": ["https://example.com/1"], "retry_delay": 1.5}',
+        '{"webhook_urls": ["https://example.com/1"], "check_interval_min": 600, "check_interval_max": 550}',
+    ],
+)
+def test_reload_keeps_config_on_invalid_file(config_file, content):
+    config = Config(config_file)
+    config_file.write_text(content)
+
+    config.reload()
+    assert config.get_targets() == ["alice"]
+    assert config.get_webhook_urls() == ["https://example.com/1"]
+    # The config file is never rewritten
+    config.get_webhook_url()
+    assert config_file.read_text() == content
+
+
+def test_reload_keeps_config_on_os_error(config_file):
+    config = Config(config_file)
+
+    config_file.unlink()
+    config.reload()
+    assert config.get_targets() == ["alice"]
+
+    config_file.mkdir()
+    assert config.has_changed()
+    config.reload()
+    assert config.get_targets() == ["alice"]
+
+
+def test_reload_applies_valid_file(config_file):
+    config = Config(config_file)
+    config_file.write_text(json.dumps({"targets": ["bob"], "webhook_urls": ["https://example.com/2"]}))
+
+    config.reload()
+    assert config.get_targets() == ["bob"]
+    assert config.get_webhook_urls() == ["https://example.com/2"]
+    assert not config.has_changed()
+
+
+def test_webhook_urls_prefer_config_file(config_file, monkeypatch):
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL_1", "https://example.com/env")
+    assert Config(config_file).get_webhook_urls() == ["https://example.com/1"]
+
+
+def test_webhook_urls_fall_back_to_set_env_vars(tmp_path, monkeypatch):
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL_1", "https://example.com/env")
+    config = Config(tmp_path / "configs.json")
+
+    assert config.get_webhook_urls() == ["https://example.com/env"]
+    assert [config.get_webhook_url() for _ in range(2)] == ["https://example.com/env"] * 2
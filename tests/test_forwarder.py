@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from instagram_forwarder.config.config import Config
+from instagram_forwarder.utils.forwarder import Forwarder
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_USERNAME", "user")
+    monkeypatch.setenv("INSTAGRAM_PASSWORD", "password")
+    config_file = tmp_path / "configs.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "targets": ["alice", "bob"],
+                "webhook_urls": ["https://discord.com/api/webhooks/1/a", "https://discord.com/api/webhooks/2/b"],
+                "check_interval_min": 3000,
+                "check_interval_max": 3600,
+            }
+        )
+    )
+    return config_file
+
+
+@pytest.fixture
+def forwarder(config_file):
+    forwarder = Forwarder(None, Config(config_file), None)
+    forwarder.reload_config()
+    return forwarder
+
+
+def write_config(config_file, **changes):
+    config_data = json.loads(config_file.read_text())
+    config_data.update(changes)
+    config_file.write_text(json.dumps(config_data))
+
+
+def test_reload_adds_targets_as_due(forwarder, config_file):
+    forwarder.next_checks["alice"] = forwarder.next_checks["bob"] = 1e9
+    write_config(config_file, targets=["alice", "bob", "carol"])
+
+    forwarder.reload_config()
+    assert forwarder.next_checks == {"alice": 1e9, "bob": 1e9, "carol": 0.0}
+
+
+def test_reload_drops_removed_targets(forwarder, config_file):
+    forwarder.user_ids.update(alice=1, bob=2)
+    write_config(config_file, targets=["alice"])
+
+    forwarder.reload_config()
+    assert list(forwarder.next_checks) == ["alice"]
+    assert forwarder.user_ids == {"alice": 1}
+
+
+def test_reload_drops_removed_webhooks(forwarder, config_file):
+    for _ in range(2):
+        forwarder._next_webhook()
+    assert forwarder.webhook_breakers["https://discord.com/api/webhooks/2/b"].name == "discord_webhook_2"
+    write_config(config_file, webhook_urls=["https://discord.com/api/webhooks/1/a"])
+
+    forwarder.reload_config()
+    assert list(forwarder.webhooks) == ["https://discord.com/api/webhooks/1/a"]
+    assert list(forwarder.webhook_breakers) == ["https://discord.com/api/webhooks/1/a"]
+
+
+def test_reload_caps_scheduled_checks_to_new_interval(forwarder, config_file):
+    forwarder.next_checks.update(alice=1e9, bob=1e9)
+    forwarder.retrying_targets.add("bob")
+    write_config(config_file, check_interval_min=30, check_interval_max=60)
+
+    forwarder.reload_config()
+    assert forwarder.next_checks["alice"] < 1e9
+    assert forwarder.next_checks["bob"] == 1e9